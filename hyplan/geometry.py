@@ -1,8 +1,11 @@
 """Geodesic geometry utilities.
 
 Coordinate conversions, distance calculations, and geometric operations
-on the WGS84 ellipsoid. All distance and bearing calculations use
-Vincenty's inverse and direct formulae via the ``pymap3d`` library.
+on the WGS84 ellipsoid. Point-to-point distances and bearings use
+Vincenty's inverse and direct formulae via the ``pymap3d`` library;
+:func:`process_linestring` solves all track segments at once with
+``pyproj.Geod`` (Karney's geodesic algorithm), which agrees with Vincenty
+to well below a millimetre.
 
 
 Geometry references
@@ -19,21 +22,24 @@ doi:10.21105/joss.00580
 from __future__ import annotations
 
 import datetime
+import math
 import numpy as np
-import random
+import shapely
 import logging
 from functools import lru_cache
 from typing import Optional, Tuple, Callable, Union, List
-from shapely.affinity import affine_transform, translate
+from shapely.affinity import translate
 from shapely.geometry import Point, LineString, Polygon, MultiPolygon
-from shapely.ops import triangulate, transform, unary_union
+from shapely.ops import triangulate, unary_union
 from shapely.geometry.base import BaseGeometry
-from pyproj import CRS
+from pyproj import CRS, Geod
 from pyproj import Transformer
 from pymap3d.lox import meanm
 from pymap3d.vincenty import vdist
 from .exceptions import HyPlanTypeError, HyPlanValueError, HyPlanRuntimeError
 
+_GEOD_WGS84 = Geod(ellps="WGS84")
+
 
 def wrap_to_180(lon: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
@@ -43,13 +49,15 @@ def wrap_to_180(lon: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         lon (float or array-like): Angle(s) in degrees.
 
     Returns:
-        numpy.ndarray or float: Angle(s) wrapped to [-180, 180).
+        numpy.ndarray or float: Angle(s) wrapped to [-180, 180). Scalar
+        inputs return a float without allocating an array.
     """
-    lon = np.mod(np.array(lon) + 180.0, 360.0) - 180.0
-    return np.squeeze(lon)  # type: ignore[no-any-return]
+    if isinstance(lon, (int, float)):
+        return (lon + 180.0) % 360.0 - 180.0
+    return np.mod(np.asarray(lon) + 180.0, 360.0) - 180.0  # type: ignore[no-any-return]
 
 
-def wrap_to_360(angle: Union[float, np.ndarray]) -> np.ndarray:
+def wrap_to_360(angle: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Wrap angle(s) to the range [0, 360) degrees.
 
@@ -57,9 +65,12 @@ def wrap_to_360(angle: Union[float, np.ndarray]) -> np.ndarray:
         angle (float or array-like): Angle(s) in degrees.
 
     Returns:
-        numpy.ndarray: Angle(s) wrapped to [0, 360).
+        numpy.ndarray or float: Angle(s) wrapped to [0, 360). Scalar inputs
+        return a float without allocating an array.
     """
-    return np.squeeze(np.mod(np.array(angle), 360.0))  # type: ignore[no-any-return]
+    if isinstance(angle, (int, float)):
+        return angle % 360.0
+    return np.mod(np.asarray(angle), 360.0)  # type: ignore[no-any-return]
 
 
 _timezone_finder = None
@@ -150,30 +161,86 @@ def _validate_polygon(polygon: Optional[Polygon]) -> Optional[bool]:
     if polygon.is_empty:
         raise HyPlanValueError("Input polygon is empty.")
 
-    if len(polygon.exterior.coords) < 4:
+    if shapely.get_num_coordinates(polygon.exterior) < 4:
         raise HyPlanValueError(
             "Input polygon has insufficient points to form a valid geometry."
         )
 
-    if not polygon.is_valid:
+    if not shapely.is_valid(polygon):
         raise HyPlanValueError(
-            f"Input polygon is invalid: {polygon.explain_validity()}"
+            f"Input polygon is invalid: {shapely.is_valid_reason(polygon)}"
         )
 
     logging.debug("Polygon validation passed.")
     return True
 
 
-def calculate_geographic_mean(geometry: Union[BaseGeometry, List[BaseGeometry]]) -> Point:
+def _validate_polygons(polygons: List[Polygon]) -> bool:
+    """
+    Validate a list of polygons, running the GEOS checks once over the whole batch.
+
+    Applies the same rules as :func:`_validate_polygon` to every element,
+    but evaluates emptiness, vertex counts and validity with Shapely's
+    vectorized predicates instead of one call per polygon.
+
+    Args:
+        polygons (list[Polygon]): The polygons to validate.
+
+    Raises:
+        HyPlanValueError: If any element fails validation. The message names
+            the index of the first offending polygon.
+
+    Returns:
+        bool: True if all polygons are valid.
+    """
+    for i, polygon in enumerate(polygons):
+        if not isinstance(polygon, Polygon):
+            if isinstance(polygon, MultiPolygon):
+                raise HyPlanValueError(
+                    f"Polygon {i}: MultiPolygon input is not supported. Provide a single Polygon."
+                )
+            raise HyPlanValueError(
+                f"Polygon {i}: Input must be a Shapely Polygon. Received type: {type(polygon)}."
+            )
+
+    arr = np.asarray(polygons, dtype=object)
+    empty = shapely.is_empty(arr)
+    if empty.any():
+        raise HyPlanValueError(f"Polygon {int(np.argmax(empty))}: Input polygon is empty.")
+
+    too_few = shapely.get_num_coordinates(shapely.get_exterior_ring(arr)) < 4
+    if too_few.any():
+        raise HyPlanValueError(
+            f"Polygon {int(np.argmax(too_few))}: Input polygon has insufficient "
+            "points to form a valid geometry."
+        )
+
+    invalid = ~shapely.is_valid(arr)
+    if invalid.any():
+        i = int(np.argmax(invalid))
+        raise HyPlanValueError(
+            f"Polygon {i}: Input polygon is invalid: {shapely.is_valid_reason(arr[i])}"
+        )
+
+    logging.debug(f"Validation passed for {len(polygons)} polygons.")
+    return True
+
+
+def calculate_geographic_mean(
+    geometry: Union[BaseGeometry, List[BaseGeometry]], as_point: bool = True
+) -> Union[Point, Tuple[float, float]]:
     """
     Calculate the geographic mean of coordinates from a Shapely geometry
     or a list of Shapely geometries using pymap3d.lox.meanm.
 
     Args:
         geometry (LineString, Polygon, Point, or list): A single Shapely geometry or a list of Shapely geometries.
+        as_point (bool): If True (default), return a Shapely Point. If False,
+            return a plain ``(lon, lat)`` tuple and skip building the Point.
 
     Returns:
-        Point: Geographic mean as a Shapely Point.
+        Point or tuple: Geographic mean as a Shapely Point, or as a
+        ``(lon, lat)`` tuple of floats when ``as_point`` is False.
     """
     # Ensure input is a single geometry or a list of geometries
     if isinstance(geometry, (LineString, Polygon, Point)):
@@ -183,27 +250,20 @@ def calculate_geographic_mean(geometry: Union[BaseGeometry, List[BaseGeometry]])
     else:
         raise HyPlanTypeError("Input must be a Shapely geometry or a list of Shapely geometries.")
 
-    # Collect all coordinates from the geometries
-    coords = []
-    for geom in geometries:
-        if isinstance(geom, Point):
-            coords.append((geom.x, geom.y))
-        elif isinstance(geom, LineString):
-            coords.extend(list(geom.coords))
-        elif isinstance(geom, Polygon):
-            coords.extend(list(geom.exterior.coords))
-
-    if not coords:
-        raise HyPlanValueError("No valid coordinates found in the provided geometries.")
+    # Collect all coordinates into one (N, 2) array; polygons contribute
+    # their exterior ring only
+    coords = shapely.get_coordinates(
+        [geom.exterior if isinstance(geom, Polygon) else geom for geom in geometries]
+    )
 
-    # Separate latitudes and longitudes
-    lats = [coord[1] for coord in coords]
-    lons = [coord[0] for coord in coords]
+    if coords.size == 0:
+        raise HyPlanValueError("No valid coordinates found in the provided geometries.")
 
     # Calculate the geographic mean
-    lat_mean, lon_mean = meanm(lats, lons)
+    lat_mean, lon_mean = meanm(coords[:, 1], coords[:, 0])
 
-    # Return as a Shapely Point
+    if not as_point:
+        return float(lon_mean), float(lat_mean)
     return Point(lon_mean, lat_mean)
 
 
@@ -213,6 +273,29 @@ def _utm_crs_from_epsg(epsg: int) -> CRS:
     return CRS.from_epsg(epsg)
 
 
+@lru_cache(maxsize=128)
+def _build_transformers(epsg_code: int) -> Tuple[Transformer, Transformer]:
+    """Return cached ``(wgs84_to_utm, utm_to_wgs84)`` transformers for a UTM zone.
+
+    Building a ``Transformer`` sets up a PROJ pipeline, which costs far more
+    than transforming a handful of points, so we keep one pair per EPSG code.
+    """
+    utm_crs = _utm_crs_from_epsg(epsg_code)
+    wgs84_to_utm = Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True)
+    utm_to_wgs84 = Transformer.from_crs(utm_crs, "EPSG:4326", always_xy=True)
+    return wgs84_to_utm, utm_to_wgs84
+
+
+def _utm_epsg(lon: float, lat: float) -> int:
+    """Return the EPSG code of the WGS84 / UTM zone containing a coordinate."""
+    zone = int((lon + 180.0) / 6.0) + 1
+    if zone < 1:
+        zone = 1
+    elif zone > 60:
+        zone = 60
+    return (32600 if lat >= 0 else 32700) + zone
+
+
 def get_utm_crs(lon: float, lat: float) -> CRS:
     """
     Determine the UTM CRS for a given WGS84 coordinate.
@@ -228,14 +311,38 @@ def get_utm_crs(lon: float, lat: float) -> CRS:
     Returns:
         CRS: The appropriate UTM CRS for the coordinate.
     """
-    zone = int((lon + 180.0) / 6.0) + 1
-    if zone < 1:
-        zone = 1
-    elif zone > 60:
-        zone = 60
-    epsg = (32600 if lat >= 0 else 32700) + zone
-    return _utm_crs_from_epsg(epsg)
+    return _utm_crs_from_epsg(_utm_epsg(lon, lat))
+
+
+
+def _get_utm_transformers(
+    geometry: Union[BaseGeometry, List[BaseGeometry]],
+) -> Tuple[Transformer, Transformer]:
+    """Return the cached ``(wgs84_to_utm, utm_to_wgs84)`` Transformers for a geometry.
 
+    Same lookup as :func:`get_utm_transforms`, but returns the ``Transformer``
+    objects themselves so callers can transform whole coordinate arrays with
+    :func:`_fast_transform`.
+    """
+    # Ensure the input is valid
+    if isinstance(geometry, list):
+        if not all(isinstance(geom, (Point, LineString, Polygon)) for geom in geometry):
+            raise HyPlanTypeError("All elements in the list must be Shapely geometries.")
+    elif not isinstance(geometry, BaseGeometry):
+        raise HyPlanTypeError("Input must be a Shapely geometry or a list of geometries.")
+
+    # Calculate the geographic mean
+    lon, lat = calculate_geographic_mean(geometry, as_point=False)
+
+    # Determine UTM CRS based on the geographic mean; transformers are
+    # cached per zone so repeated calls in the same zone skip PROJ setup.
+    try:
+        transformers = _build_transformers(_utm_epsg(lon, lat))
+    except ValueError as e:
+        raise HyPlanValueError(f"Failed to determine UTM CRS for centroid ({lon}, {lat}): {e}")
+
+    logging.debug(f"Generated UTM transformations for centroid ({lat:.6f}, {lon:.6f}).")
+    return transformers
 
 
 def get_utm_transforms(geometry: Union[BaseGeometry, List[BaseGeometry]]) -> Tuple[Callable, Callable]:
@@ -253,29 +360,22 @@ def get_utm_transforms(geometry: Union[BaseGeometry, List[BaseGeometry]]) -> Tup
     Raises:
         ValueError: If the geometry is invalid, empty, or has no valid centroid.
     """
-    # Ensure the input is valid
-    if isinstance(geometry, list):
-        if not all(isinstance(geom, (Point, LineString, Polygon)) for geom in geometry):
-            raise HyPlanTypeError("All elements in the list must be Shapely geometries.")
-    elif not isinstance(geometry, BaseGeometry):
-        raise HyPlanTypeError("Input must be a Shapely geometry or a list of geometries.")
+    wgs84_to_utm, utm_to_wgs84 = _get_utm_transformers(geometry)
+    return wgs84_to_utm.transform, utm_to_wgs84.transform
 
-    # Calculate the geographic mean
-    centroid = calculate_geographic_mean(geometry)
-    lon, lat = centroid.x, centroid.y
 
-    # Determine UTM CRS based on the geographic mean
-    try:
-        utm_crs = get_utm_crs(lon, lat)
-    except ValueError as e:
-        raise HyPlanValueError(f"Failed to determine UTM CRS for centroid ({lon}, {lat}): {e}")
+def _fast_transform(transformer: Transformer, geom: BaseGeometry) -> BaseGeometry:
+    """Apply a pyproj ``Transformer`` to every coordinate of a geometry at once.
 
-    # Define transformation functions
-    wgs84_to_utm = Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True).transform
-    utm_to_wgs84 = Transformer.from_crs(utm_crs, "EPSG:4326", always_xy=True).transform
+    Unlike ``shapely.ops.transform``, which invokes the function once per
+    ring or part, this hands all coordinates to PROJ in a single call.
+    Z values of 3D geometries are passed through the transformer and kept.
+    """
+    def _apply(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coords.T))
+
+    return shapely.transform(geom, _apply, include_z=geom.has_z)
 
-    logging.debug(f"Generated UTM transformations for centroid ({lat:.6f}, {lon:.6f}).")
-    return wgs84_to_utm, utm_to_wgs84
 
 def haversine(
     lat1: Union[float, np.ndarray],
@@ -303,15 +403,68 @@ def haversine(
         Distance(s) in the same unit as ``radius``. Returns a scalar if all
         inputs are scalars, otherwise a numpy array broadcast to the inputs.
     """
-    phi1 = np.radians(lat1)
-    phi2 = np.radians(lat2)
-    delta_phi = np.radians(np.subtract(lat2, lat1))
-    delta_lambda = np.radians(np.subtract(lon2, lon1))
+    if all(isinstance(v, (int, float)) for v in (lat1, lon1, lat2, lon2)):
+        # Scalar fast path: ``math`` avoids NumPy's 0-d array dispatch,
+        # which dominates when this is called inside a Python loop.
+        phi1 = math.radians(lat1)
+        phi2 = math.radians(lat2)
+        sin_dphi = math.sin(math.radians(lat2 - lat1) / 2)
+        sin_dlambda = math.sin(math.radians(lon2 - lon1) / 2)
+        a = sin_dphi ** 2 + math.cos(phi1) * math.cos(phi2) * sin_dlambda ** 2
+        return radius * 2 * math.asin(min(1.0, math.sqrt(a)))
+
+    # Array path. c = 2 * asin(sqrt(a)) needs one inverse-trig call where
+    # the atan2 form needs atan2 plus a second sqrt. The clamp guards
+    # against a creeping past 1 by rounding near antipodal points.
+    phi1_arr = np.radians(lat1)
+    phi2_arr = np.radians(lat2)
+    sin_dphi_arr = np.sin(np.radians(np.subtract(lat2, lat1)) * 0.5)
+    sin_dlambda_arr = np.sin(np.radians(np.subtract(lon2, lon1)) * 0.5)
+
+    hav = (
+        sin_dphi_arr * sin_dphi_arr
+        + np.cos(phi1_arr) * np.cos(phi2_arr) * (sin_dlambda_arr * sin_dlambda_arr)
+    )
 
-    a = np.sin(delta_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
-    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    if isinstance(hav, np.ndarray) and hav.ndim and hav.flags.writeable:
+        # A fresh ndarray with the full broadcast shape of the inputs: finish
+        # in place to avoid further full-size temporaries
+        np.sqrt(hav, out=hav)
+        np.minimum(hav, 1.0, out=hav)
+        np.arcsin(hav, out=hav)
+    else:
+        # pandas objects, NumPy scalars, etc.: plain ufuncs keep the input
+        # type (e.g. a Series in gives a Series out)
+        hav = np.arcsin(np.minimum(np.sqrt(hav), 1.0))
+
+    # Not in place, so an array ``radius`` can still broadcast
+    return hav * (2 * radius)  # type: ignore[no-any-return]
+
+@lru_cache(maxsize=64)
+def _triangulation_setup(poly_wkb: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Triangulate a polygon and return per-triangle areas and affine transforms.
+
+    Keyed on the polygon's WKB so repeated sampling from the same polygon
+    skips the Delaunay triangulation. The returned arrays are read-only
+    because they are shared between calls.
+
+    Returns:
+        Tuple ``(areas, transforms)``: areas with shape (T,), and rows of
+        ``[a, b, d, e, xoff, yoff]`` mapping the unit triangle onto each
+        triangle, with shape (T, 6).
+    """
+    areas = []
+    transforms = []
+    for t in triangulate(shapely.from_wkb(poly_wkb)):
+        areas.append(t.area)
+        (x0, y0), (x1, y1), (x2, y2), _ = t.exterior.coords
+        transforms.append([x1 - x0, x2 - x0, y1 - y0, y2 - y0, x0, y0])
+    areas_arr = np.array(areas)
+    transforms_arr = np.array(transforms)
+    areas_arr.setflags(write=False)
+    transforms_arr.setflags(write=False)
+    return areas_arr, transforms_arr
 
-    return radius * c  # type: ignore[no-any-return]
 
 def random_points_in_polygon(polygon: Polygon, k: int) -> List[Point]:
     """
@@ -327,21 +480,20 @@ def random_points_in_polygon(polygon: Polygon, k: int) -> List[Point]:
     Returns:
         list[Point]: List of k Shapely Point objects inside the polygon.
     """
-    areas = []
-    transforms = []
-    for t in triangulate(polygon):
-        areas.append(t.area)
-        (x0, y0), (x1, y1), (x2, y2), _ = t.exterior.coords
-        transforms.append([x1 - x0, x2 - x0, y2 - y0, y1 - y0, x0, y0])
-    points = []
-    for tri_transform in random.choices(transforms, weights=areas, k=k):
-        x, y = [random.random() for _ in range(2)]
-        if x + y > 1:
-            p = Point(1 - x, 1 - y)
-        else:
-            p = Point(x, y)
-        points.append(affine_transform(p, tri_transform))
-    return points
+    areas_arr, transforms_arr = _triangulation_setup(polygon.wkb)
+
+    # Pick a triangle per point (area-weighted), draw (u, v) in the unit
+    # square and fold it into the unit triangle, then map every sample
+    # through its triangle's affine transform in one shot.
+    idx = np.random.choice(len(areas_arr), size=k, p=areas_arr / areas_arr.sum())
+    uv = np.random.random((k, 2))
+    outside = uv.sum(axis=1) > 1
+    uv[outside] = 1 - uv[outside]
+
+    A = transforms_arr[idx]
+    x = A[:, 0] * uv[:, 0] + A[:, 1] * uv[:, 1] + A[:, 4]
+    y = A[:, 2] * uv[:, 0] + A[:, 3] * uv[:, 1] + A[:, 5]
+    return list(shapely.points(x, y))
 
 
 
@@ -354,33 +506,29 @@ def minimum_rotated_rectangle(polygon: Polygon) -> Polygon:
         polygon (Polygon): Input polygon in WGS84 coordinates. Must be valid.
 
     Returns:
-        tuple: A tuple containing:
-            - lat0 (float): Latitude of the rectangle's centroid.
-            - lon0 (float): Longitude of the rectangle's centroid.
-            - azimuth (float): Azimuth of the rectangle in degrees, wrapped to [-180, 180].
-            - length (float): Length of the rectangle's longer side (meters).
-            - width (float): Width of the rectangle's shorter side (meters).
-            - mrr_wgs84 (Polygon): Minimum rotated rectangle in WGS84 coordinates.
-            - hull_wgs84 (Polygon): Convex hull of the polygon in WGS84 coordinates.
+        Polygon: Minimum rotated rectangle in WGS84 coordinates. Use
+        :func:`rectangle_dimensions` to get its centroid, orientation and
+        side lengths.
 
     Raises:
         ValueError: If the input polygon is invalid or processing fails.
 
     Notes:
         - The input polygon is transformed to UTM for accurate geometry calculations.
-        - Returns both the rectangle and the convex hull in WGS84 coordinates.
+        - Concave inputs give the same rectangle as their convex hull.
     """
     _validate_polygon(polygon)
 
     try:
-        wgs84_to_utm, utm_to_wgs84 = get_utm_transforms(polygon)
+        wgs84_to_utm, utm_to_wgs84 = _get_utm_transformers(polygon)
 
-        # Transform to UTM and calculate convex hull and minimum rotated rectangle
-        polygon_utm = transform(wgs84_to_utm, polygon).convex_hull
+        # Transform to UTM and calculate the minimum rotated rectangle. GEOS
+        # computes the convex hull internally, so no explicit hull is taken.
+        polygon_utm = _fast_transform(wgs84_to_utm, polygon)
         mrr = polygon_utm.minimum_rotated_rectangle
 
         # Transform results back to WGS84
-        mrr_wgs84 = transform(utm_to_wgs84, mrr)
+        mrr_wgs84 = _fast_transform(utm_to_wgs84, mrr)
 
     except Exception as e:
         raise HyPlanValueError(f"Failed to calculate minimum rotated rectangle: {e}")
@@ -388,6 +536,37 @@ def minimum_rotated_rectangle(polygon: Polygon) -> Polygon:
     return mrr_wgs84
 
 
+def _rotated_bbox_core(
+    coords: np.ndarray, cx: float, cy: float, c: float, s: float
+) -> np.ndarray:
+    """Bounding box of points rotated by an angle about ``(cx, cy)``, in the original frame.
+
+    Args:
+        coords: (N, 2) float64 array of point coordinates.
+        cx, cy: Center of rotation.
+        c, s: Cosine and sine of the rotation angle.
+
+    Returns:
+        (5, 2) array of closed-ring corner coordinates.
+    """
+    # Rows of P @ R.T are rotated by +angle and rows of B @ R are rotated
+    # back by -angle, so each direction is a single matrix product.
+    R = np.array([[c, -s], [s, c]])
+    center = np.array([cx, cy])
+    rotated = (coords - center) @ R.T
+
+    minx_r, miny_r = rotated.min(axis=0)
+    maxx_r, maxy_r = rotated.max(axis=0)
+    bbox_r = np.array([
+        [minx_r, miny_r],
+        [minx_r, maxy_r],
+        [maxx_r, maxy_r],
+        [maxx_r, miny_r],
+        [minx_r, miny_r],
+    ])
+    return bbox_r @ R + center  # type: ignore[no-any-return]
+
+
 def rotated_rectangle(polygon: Polygon, azimuth: float) -> Polygon:
     """
     Compute a rotated bounding rectangle around a Shapely polygon in WGS84 coordinates at a specified azimuth.
@@ -412,35 +591,18 @@ def rotated_rectangle(polygon: Polygon, azimuth: float) -> Polygon:
 
     try:
         # Transform polygon to UTM
-        wgs84_to_utm, utm_to_wgs84 = get_utm_transforms(polygon)
-        polygon_utm = transform(wgs84_to_utm, polygon).convex_hull
-
-        # Perform rotation
-        azimuth_radians = np.radians(azimuth)
-        cx, cy = polygon_utm.centroid.x, polygon_utm.centroid.y
-        xt, yt = polygon_utm.exterior.xy
-        xt, yt = np.array(xt) - cx, np.array(yt) - cy
-
-        # Rotate coordinates
-        xr = xt * np.cos(azimuth_radians) - yt * np.sin(azimuth_radians)
-        yr = xt * np.sin(azimuth_radians) + yt * np.cos(azimuth_radians)
-
-        # Compute bounding box in rotated space
-        minx_r: float
-        miny_r: float
-        maxx_r: float
-        maxy_r: float
-        minx_r, miny_r, maxx_r, maxy_r = np.min(xr), np.min(yr), np.max(xr), np.max(yr)
-        xbound_r = np.array([minx_r, minx_r, maxx_r, maxx_r, minx_r])
-        ybound_r = np.array([miny_r, maxy_r, maxy_r, miny_r, miny_r])
-
-        # Rotate bounding box back to original space
-        xbound = (xbound_r * np.cos(-azimuth_radians) - ybound_r * np.sin(-azimuth_radians)) + cx
-        ybound = (xbound_r * np.sin(-azimuth_radians) + ybound_r * np.cos(-azimuth_radians)) + cy
-
-        # Create rotated bounding box
-        rotated_bbox_utm = Polygon(zip(xbound, ybound))
-        rotated_bbox_wgs84 = transform(utm_to_wgs84, rotated_bbox_utm)
+        wgs84_to_utm, utm_to_wgs84 = _get_utm_transformers(polygon)
+        polygon_utm = _fast_transform(wgs84_to_utm, polygon).convex_hull
+
+        # Rotate about the centroid and take the bounding box
+        azimuth_radians = math.radians(azimuth)
+        coords = shapely.get_coordinates(polygon_utm.exterior)
+        cx, cy = polygon_utm.centroid.coords[0]
+        corners = _rotated_bbox_core(
+            coords, cx, cy, math.cos(azimuth_radians), math.sin(azimuth_radians)
+        )
+        rotated_bbox_utm = Polygon(corners)
+        rotated_bbox_wgs84 = _fast_transform(utm_to_wgs84, rotated_bbox_utm)
 
     except Exception as e:
         raise HyPlanValueError(f"Failed to compute rotated bounding rectangle: {e}")
@@ -508,11 +670,11 @@ def translate_polygon(polygon: Polygon, distance: float, azimuth: float) -> Poly
     """
 
     # Convert the angle to radians
-    azimuth_radians = np.radians(azimuth)
+    azimuth_radians = math.radians(azimuth)
 
     # Calculate the x and y offsets
-    x_offset = distance * np.sin(azimuth_radians)
-    y_offset = distance * np.cos(azimuth_radians)
+    x_offset = distance * math.sin(azimuth_radians)
+    y_offset = distance * math.cos(azimuth_radians)
 
     # Translate the polygon
     translated_polygon = translate(polygon, xoff=x_offset, yoff=y_offset)
@@ -522,23 +684,28 @@ def translate_polygon(polygon: Polygon, distance: float, azimuth: float) -> Poly
 
 def buffer_polygon_along_azimuth(polygon: Polygon, along_track_distance: float, across_track_distance: float, azimuth: float) -> Polygon:
     """
-    Translate a Shapely polygon in both a specified direction and its opposite,
-    then compute the convex hull of the union of the two translated polygons.
+    Expand a Shapely polygon along and across a given azimuth.
+
+    The polygon is translated forward and back along ``azimuth`` by
+    ``along_track_distance`` and each of those copies is translated left and
+    right by ``across_track_distance``; the result is the union of all nine
+    copies.
 
     Args:
         polygon (Polygon): The input Shapely polygon to be buffered in WGS84 coordinates. Must be valid.
-        distance (ureg.Quantity): Distance to translate the polygon. Must be a positive length Quantity.
-        azimuth (float): Angle of translation in degrees, measured clockwise from north.
+        along_track_distance (float): Along-track translation distance in meters. Must be positive.
+        across_track_distance (float): Across-track translation distance in meters. Must be positive.
+        azimuth (float): Along-track direction in degrees, measured clockwise from north.
 
     Returns:
-        Polygon: The convex hull of the union of the two translated polygons in WGS84 coordinates.
+        Polygon: The union of the translated polygons in WGS84 coordinates.
 
     Raises:
-        ValueError: If the input polygon is invalid or if distance is not a valid length.
+        ValueError: If the input polygon is invalid or if a distance is not a positive float.
 
     Notes:
         - The input polygon is transformed to UTM for accurate geometry calculations.
-        - The resulting convex hull is returned in WGS84 coordinates.
+        - The result is not a convex hull; concavities of the input are kept.
     """
     # Validate inputs
     _validate_polygon(polygon)
@@ -553,22 +720,26 @@ def buffer_polygon_along_azimuth(polygon: Polygon, along_track_distance: float,
 
     try:
         # Transform to UTM
-        wgs84_to_utm, utm_to_wgs84 = get_utm_transforms(polygon)
-        polygon_utm = transform(wgs84_to_utm, polygon)
-
-        translated_polygon_1 = translate_polygon(polygon_utm, along_track_distance, azimuth)
-        translated_polygon_2 = translate_polygon(polygon_utm, along_track_distance, azimuth-180)
-
-        polygon_utm_translated = unary_union([translated_polygon_1, translated_polygon_2, polygon_utm])
-
-        # Translate in both directions
-        translated_polygon_1 = translate_polygon(polygon_utm_translated, across_track_distance, azimuth+90)
-        translated_polygon_2 = translate_polygon(polygon_utm_translated, across_track_distance, azimuth-90)
-
-        # Compute the union of the translated polygons
-        polygon_utm = unary_union([translated_polygon_1, translated_polygon_2, polygon_utm_translated])
-
-        buffered_polygon_wgs84 = transform(utm_to_wgs84, polygon_utm)
+        wgs84_to_utm, utm_to_wgs84 = _get_utm_transformers(polygon)
+        polygon_utm = _fast_transform(wgs84_to_utm, polygon)
+
+        # Along-track unit vector is (sin az, cos az); across-track (az + 90)
+        # is (cos az, -sin az), so one sin/cos pair gives every offset.
+        sin_az = math.sin(math.radians(azimuth))
+        cos_az = math.cos(math.radians(azimuth))
+        along_dx, along_dy = along_track_distance * sin_az, along_track_distance * cos_az
+        across_dx, across_dy = across_track_distance * cos_az, -across_track_distance * sin_az
+
+        # Shift forward/back along track and left/right across track, and
+        # union all nine copies in a single pass.
+        copies = [
+            translate(polygon_utm, xoff=i * along_dx + j * across_dx, yoff=i * along_dy + j * across_dy)
+            for i in (-1, 0, 1)
+            for j in (-1, 0, 1)
+        ]
+        polygon_utm = unary_union(copies)
+
+        buffered_polygon_wgs84 = _fast_transform(utm_to_wgs84, polygon_utm)
 
     except Exception as e:
         raise HyPlanValueError(f"Failed to buffer polygon along azimuth: {e}")
@@ -593,44 +764,90 @@ def process_linestring(linestring: LineString) -> Tuple[np.ndarray, np.ndarray,
     if not isinstance(linestring, LineString):
         raise HyPlanValueError("Input must be a LineString object.")
 
-    # Extract coordinates
-    coordinates = np.array(linestring.coords)
-    track_lat = coordinates[:, 1]
-    track_lon = coordinates[:, 0]
+    coordinates = shapely.get_coordinates(linestring)
+    return process_linestrings_batch(coordinates, np.array([0, len(coordinates)]))
 
-    # Wrap longitude to the range [-180, 180]
-    track_lon = (track_lon + 180) % 360 - 180
 
-    # Calculate azimuths between consecutive track points
-    azimuths = []
-    distances = []
+def process_linestrings_batch(
+    all_coords: np.ndarray, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Process many WGS84 tracks at once, as :func:`process_linestring` does for one.
 
-    for i in range(len(track_lat) - 1):
-        distance, az12 = vdist(
-            track_lat[i], track_lon[i], track_lat[i + 1], track_lon[i + 1]
-        )
-        azimuths.append(float(az12))
-        distances.append(float(distance))
+    The tracks are stored back to back in a single coordinate array and
+    delimited by ``offsets``: track ``t`` is ``all_coords[offsets[t]:offsets[t + 1]]``.
+    Every segment of every track is solved in one vectorized geodesic call.
 
-    # Add reverse azimuth for the last point to match array sizes
-    if len(track_lat) > 1:
-        _, reverse_az = vdist(
-            track_lat[-1], track_lon[-1], track_lat[-2], track_lon[-2]
-        )
-        azimuths.append(float((reverse_az + 180) % 360))  # Reverse azimuth with normalization
-    else:
-        azimuths.append(0.0)  # Single point, azimuth is undefined
+    Parameters:
+        all_coords (numpy.ndarray): (N, 2) array of ``(lon, lat)`` in decimal degrees.
+        offsets (numpy.ndarray): (M + 1,) non-decreasing track boundaries, with
+            ``offsets[0] == 0`` and ``offsets[-1] == N``.
 
-    # Compute cumulative along-track distances
-    distances = np.array(distances)
-    along_track_distance = np.insert(np.cumsum(distances), 0, 0)
+    Returns:
+        tuple: Four (N,) arrays aligned with ``all_coords``:
+            - numpy.ndarray: Latitudes of the track points.
+            - numpy.ndarray: Longitudes of the track points, wrapped to [-180, 180).
+            - numpy.ndarray: Azimuths between consecutive points of each track.
+            - numpy.ndarray: Cumulative along-track distance in meters, restarting
+              at 0 for each track.
 
-    return (
-        np.array(track_lat),
-        np.array(track_lon),
-        np.array(azimuths),
-        along_track_distance,
+    Raises:
+        HyPlanValueError: If the array shapes or offsets are inconsistent.
+    """
+    coords = np.asarray(all_coords, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise HyPlanValueError(f"all_coords must have shape (N, 2); got {coords.shape}.")
+    n = len(coords)
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != n:
+        raise HyPlanValueError("offsets must be a 1-D array running from 0 to len(all_coords).")
+    counts = np.diff(offsets)
+    if np.any(counts < 0):
+        raise HyPlanValueError("offsets must be non-decreasing.")
+
+    track_lat = coords[:, 1].copy()
+    track_lon = (coords[:, 0] + 180) % 360 - 180
+    if n == 0:
+        return track_lat, track_lon, np.zeros(0), np.zeros(0)
+
+    # Solve every consecutive pair in one vectorized geodesic call,
+    # including the pairs that straddle two tracks, which are masked out
+    # below. pymap3d's vdist is not used here because its array mode
+    # mis-handles coincident consecutive points.
+    fwd_az, back_az, distances = _GEOD_WGS84.inv(
+        track_lon[:-1], track_lat[:-1], track_lon[1:], track_lat[1:]
     )
+    # Outputs are preallocated and filled in place; Geod.inv already
+    # returns fresh arrays, so those are modified in place too.
+    ends = offsets[1:][counts > 0] - 1       # last point of each non-empty track
+    distances[ends[:-1]] = 0.0
+
+    # Match the vdist convention: azimuths in [0, 360), zero for
+    # zero-length segments
+    azimuths = np.empty(n)
+    np.mod(fwd_az, 360, out=azimuths[:-1])
+    azimuths[:-1][distances == 0] = 0.0
+    azimuths[-1] = 0.0
+
+    # The last point of each track takes the reverse of the azimuth back
+    # to its predecessor; single-point tracks have no defined azimuth. A
+    # zero-length final segment gives vdist's 0 reversed, i.e. 180.
+    starts = offsets[:-1][counts > 0]
+    multi = ends > starts
+    last_seg = ends[multi] - 1
+    azimuths[ends[multi]] = np.where(
+        distances[last_seg] > 0, (back_az[last_seg] + 180) % 360, 180.0
+    )
+    azimuths[ends[~multi]] = 0.0
+
+    # Cumulative along-track distance, restarted at each track start
+    along_track_distance = np.empty(n)
+    along_track_distance[0] = 0.0
+    np.cumsum(distances, out=along_track_distance[1:])
+    if len(ends) > 1:
+        along_track_distance -= np.repeat(along_track_distance[starts], counts[counts > 0])
+
+    return track_lat, track_lon, azimuths, along_track_distance
 
 
 # ---------------------------------------------------------------------------
@@ -2,8 +2,10 @@
 
 import pytest
 import numpy as np
+import pandas as pd
 from shapely.geometry import Polygon, Point, LineString, MultiPolygon
 from shapely.ops import transform
+from pymap3d.vincenty import vdist
 from hyplan.geometry import (
     wrap_to_180,
     wrap_to_360,
@@ -12,10 +14,12 @@ from hyplan.geometry import (
     calculate_geographic_mean,
     minimum_rotated_rectangle,
     _validate_polygon,
+    _validate_polygons,
     get_utm_transforms,
     rotated_rectangle,
     buffer_polygon_along_azimuth,
     process_linestring,
+    process_linestrings_batch,
     dd_to_ddms,
     dd_to_nddmm,
     dd_to_ddm,
@@ -24,6 +28,10 @@ from hyplan.geometry import (
     random_points_in_polygon,
     true_to_magnetic,
     get_timezone,
+    _fast_transform,
+    _get_utm_transformers,
+    _rotated_bbox_core,
+    _triangulation_setup,
 )
 from hyplan.exceptions import HyPlanValueError, HyPlanTypeError
 
@@ -61,6 +69,15 @@ class TestWrapAngles:
         assert wrap_to_360(370) == pytest.approx(10)
         assert wrap_to_360(0) == pytest.approx(0)
 
+    def test_scalar_returns_float(self):
+        assert isinstance(wrap_to_180(190.0), float)
+        assert isinstance(wrap_to_360(-10), float)
+
+    def test_array_matches_scalar(self):
+        angles = np.array([-370.0, -190.0, -10.0, 0.0, 180.0, 359.5, 725.0])
+        np.testing.assert_allclose(wrap_to_180(angles), [wrap_to_180(float(a)) for a in angles])
+        np.testing.assert_allclose(wrap_to_360(angles), [wrap_to_360(float(a)) for a in angles])
+
 
 class TestHaversine:
     def test_zero_distance(self):
@@ -76,6 +93,39 @@ class TestHaversine:
         dist = haversine(0, 0, 0, 1)
         assert dist == pytest.approx(111195, rel=0.01)
 
+    def test_antipodal(self):
+        expected = np.pi * 6371e3
+        assert haversine(0.0, 0.0, 0.0, 180.0) == pytest.approx(expected)
+        assert haversine(np.array([0.0, 45.0]), 0.0, np.array([0.0, -45.0]), 180.0) == pytest.approx(
+            [expected, expected]
+        )
+
+    def test_pandas_series(self):
+        df = pd.DataFrame({"lat": [34.05, -33.87, 51.47], "lon": [-118.25, 151.21, -0.45]})
+        dist = haversine(df["lat"], df["lon"], 0.0, 0.0)
+        assert isinstance(dist, pd.Series)
+        expected = haversine(df["lat"].to_numpy(), df["lon"].to_numpy(), 0.0, 0.0)
+        np.testing.assert_allclose(dist.to_numpy(), expected)
+
+    def test_read_only_input(self):
+        lats = np.array([34.05, -33.87, 51.47])
+        lats.flags.writeable = False
+        dist = haversine(lats, 0.0, 0.0, 0.0)
+        np.testing.assert_allclose(dist, [haversine(float(v), 0.0, 0.0, 0.0) for v in lats])
+
+    def test_array_radius_broadcasts(self):
+        radii = np.array([6371e3, 6378137.0])
+        dist = haversine(np.array([[0.0], [10.0]]), 0.0, 0.0, 1.0, radius=radii)
+        assert dist.shape == (2, 2)
+        assert dist[0, 1] == pytest.approx(haversine(0.0, 0.0, 0.0, 1.0, radius=6378137.0))
+
+    def test_scalar_matches_array(self):
+        lats = np.array([34.05, -33.87, 51.47])
+        lons = np.array([-118.25, 151.21, -0.45])
+        vec = haversine(lats, lons, 40.64, -73.78)
+        for i in range(len(lats)):
+            assert haversine(float(lats[i]), float(lons[i]), 40.64, -73.78) == pytest.approx(vec[i])
+
 
 class TestUTM:
     def test_get_utm_crs(self):
@@ -84,6 +134,16 @@ class TestUTM:
         # EPSG codes for UTM zones are 326xx (north) and 327xx (south)
         assert "326" in crs.to_string() or "327" in crs.to_string()
 
+    @pytest.mark.parametrize("lon, lat, epsg", [
+        (-118.25, 34.05, 32611),   # Los Angeles
+        (151.21, -33.87, 32756),   # Sydney
+        (0.0, 0.0, 32631),         # zone boundary, equator counts as north
+        (-180.0, 10.0, 32601),
+        (180.0, -10.0, 32760),     # antimeridian clamps to zone 60
+    ])
+    def test_get_utm_crs_epsg(self, lon, lat, epsg):
+        assert get_utm_crs(lon, lat).to_epsg() == epsg
+
 
 class TestGeographicMean:
     def test_point_mean(self):
@@ -104,6 +164,13 @@ class TestMinimumRotatedRectangle:
         # The minimum rotated rectangle must contain the original polygon
         assert rect.contains(simple_polygon) or rect.buffer(1e-6).contains(simple_polygon)
 
+    def test_concave_matches_hull(self):
+        # An L-shaped polygon has the same minimum rectangle as its hull
+        ell = Polygon([(0, 0), (0.1, 0), (0.1, 0.02), (0.02, 0.02), (0.02, 0.08), (0, 0.08)])
+        rect = minimum_rotated_rectangle(ell)
+        hull_rect = minimum_rotated_rectangle(ell.convex_hull)
+        assert rect.symmetric_difference(hull_rect).area < 1e-12
+
 
 # ---------------------------------------------------------------------------
 # New tests
@@ -136,6 +203,32 @@ class TestValidatePolygon:
         with pytest.raises(HyPlanValueError, match="Input must be a Shapely Polygon"):
             _validate_polygon(Point(0, 0))
 
+    def test_self_intersecting_raises(self):
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        with pytest.raises(HyPlanValueError, match="invalid: Self-intersection"):
+            _validate_polygon(bowtie)
+
+
+class TestValidatePolygons:
+    def test_valid_batch(self, simple_polygon, unit_polygon):
+        assert _validate_polygons([simple_polygon, unit_polygon]) is True
+
+    def test_empty_batch(self):
+        assert _validate_polygons([]) is True
+
+    def test_reports_index_of_invalid(self, simple_polygon):
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        with pytest.raises(HyPlanValueError, match="Polygon 1: .*invalid"):
+            _validate_polygons([simple_polygon, bowtie])
+
+    def test_empty_polygon_raises(self, simple_polygon):
+        with pytest.raises(HyPlanValueError, match="Polygon 1: .*empty"):
+            _validate_polygons([simple_polygon, Polygon()])
+
+    def test_non_polygon_raises(self, simple_polygon):
+        with pytest.raises(HyPlanValueError, match="Polygon 0: Input must be"):
+            _validate_polygons([Point(0, 0), simple_polygon])
+
 
 class TestGetUtmTransforms:
     def test_round_trip(self, simple_polygon):
@@ -166,6 +259,32 @@ class TestGetUtmTransforms:
         with pytest.raises(HyPlanTypeError):
             get_utm_transforms("not a geometry")
 
+    def test_fast_transform_matches_ops_transform(self):
+        poly = Polygon(
+            [(-118.3, 34.0), (-118.2, 34.0), (-118.2, 34.1), (-118.3, 34.1)],
+            holes=[[(-118.27, 34.03), (-118.23, 34.03), (-118.25, 34.07)]],
+        )
+        to_utm, _ = _get_utm_transformers(poly)
+        expected = transform(to_utm.transform, poly)
+        result = _fast_transform(to_utm, poly)
+        assert result.equals_exact(expected, tolerance=1e-6)
+
+    def test_fast_transform_keeps_z(self):
+        poly = Polygon([(-118.3, 34.0, 10), (-118.2, 34.0, 20), (-118.2, 34.1, 30)])
+        to_utm, _ = _get_utm_transformers(poly)
+        result = _fast_transform(to_utm, poly)
+        assert result.has_z
+        np.testing.assert_allclose(
+            np.asarray(result.exterior.coords)[:, 2], [10, 20, 30, 10]
+        )
+        assert not _fast_transform(to_utm, Polygon([(0, 0), (1, 0), (1, 1)])).has_z
+
+    def test_transformers_reused_within_zone(self):
+        to_utm_a, from_utm_a = get_utm_transforms(Point(-118.25, 34.05))
+        to_utm_b, from_utm_b = get_utm_transforms(Point(-118.0, 34.5))
+        assert to_utm_a.__self__ is to_utm_b.__self__
+        assert from_utm_a.__self__ is from_utm_b.__self__
+
 
 class TestRotatedRectangle:
     def test_zero_azimuth_contains_input(self, simple_polygon):
@@ -184,6 +303,17 @@ class TestRotatedRectangle:
         rect = rotated_rectangle(simple_polygon, azimuth=90.0)
         assert rect.buffer(1e-6).contains(simple_polygon)
 
+    def test_bbox_core_diamond(self):
+        # A diamond rotated by 45 degrees about its center is an axis-aligned
+        # square in the rotated frame, so its bbox is the diamond itself.
+        x = np.array([10.0, 11.0, 10.0, 9.0, 10.0])
+        y = np.array([21.0, 20.0, 19.0, 20.0, 21.0])
+        az = np.radians(45.0)
+        corners = _rotated_bbox_core(np.column_stack([x, y]), 10.0, 20.0, np.cos(az), np.sin(az))
+        assert corners.shape == (5, 2)
+        assert Polygon(corners).area == pytest.approx(2.0)
+        assert Polygon(corners).symmetric_difference(Polygon(zip(x, y))).area < 1e-9
+
 
 class TestBufferPolygonAlongAzimuth:
     def test_output_larger_than_input(self, simple_polygon):
@@ -204,6 +334,31 @@ class TestBufferPolygonAlongAzimuth:
         )
         assert buffered.buffer(1e-6).contains(simple_polygon)
 
+    def test_extent_grows_by_offsets(self, simple_polygon):
+        # For a north-pointing azimuth the along-track offset stretches the
+        # polygon north/south and the across-track offset east/west.
+        to_utm, _ = _get_utm_transformers(simple_polygon)
+        buffered = buffer_polygon_along_azimuth(
+            simple_polygon,
+            along_track_distance=2000.0,
+            across_track_distance=500.0,
+            azimuth=0.0,
+        )
+        x0, y0, x1, y1 = _fast_transform(to_utm, simple_polygon).bounds
+        bx0, by0, bx1, by1 = _fast_transform(to_utm, buffered).bounds
+        assert (by1 - by0) - (y1 - y0) == pytest.approx(4000.0, abs=1.0)
+        assert (bx1 - bx0) - (x1 - x0) == pytest.approx(1000.0, abs=1.0)
+
+    def test_3d_input_keeps_z(self):
+        poly_z = Polygon([(-118.3, 34.0, 5), (-118.2, 34.0, 5), (-118.2, 34.1, 5), (-118.3, 34.1, 5)])
+        buffered = buffer_polygon_along_azimuth(
+            poly_z,
+            along_track_distance=1000.0,
+            across_track_distance=500.0,
+            azimuth=20.0,
+        )
+        assert buffered.has_z
+
     def test_invalid_distance_raises(self, simple_polygon):
         with pytest.raises(HyPlanValueError):
             buffer_polygon_along_azimuth(
@@ -247,11 +402,81 @@ class TestProcessLinestring:
         # Heading east -> azimuth ~ 90 degrees
         assert azimuths[0] == pytest.approx(90.0, abs=0.5)
 
+    def test_matches_vincenty(self):
+        coords = [(-118.0, 34.0), (-118.1, 34.1), (-117.9, 34.3), (-117.5, 34.2)]
+        _, _, azimuths, distances = process_linestring(LineString(coords))
+        for i in range(len(coords) - 1):
+            (lon1, lat1), (lon2, lat2) = coords[i], coords[i + 1]
+            dist, az = vdist(lat1, lon1, lat2, lon2)
+            assert distances[i + 1] - distances[i] == pytest.approx(dist, abs=1e-3)
+            assert azimuths[i] == pytest.approx(az, abs=1e-6)
+
+    def test_repeated_point(self):
+        ls = LineString([(0.0, 0.0), (0.0, 1.0), (0.0, 1.0), (0.0, 2.0)])
+        _, _, azimuths, distances = process_linestring(ls)
+        assert azimuths[1] == 0.0
+        assert distances[2] == distances[1]
+        assert np.all(np.isfinite(azimuths))
+
+    def test_repeated_final_point(self):
+        # Matches the original per-segment vdist loop, which reversed the
+        # 0 azimuth vdist returns for coincident points
+        ls = LineString([(0.0, 0.0), (0.0, 1.0), (0.0, 1.0)])
+        _, _, azimuths, distances = process_linestring(ls)
+        assert azimuths[1] == 0.0
+        assert azimuths[2] == 180.0
+        assert distances[2] == distances[1]
+
     def test_invalid_input_raises(self):
         with pytest.raises(HyPlanValueError):
             process_linestring("not a linestring")
 
 
+class TestProcessLinestringsBatch:
+    @pytest.fixture
+    def tracks(self):
+        return [
+            [(-118.0, 34.0), (-118.1, 34.1), (-117.9, 34.3)],
+            [(170.0, -10.0)],
+            [(179.9, 0.0), (-179.9, 0.1), (-179.5, 0.3), (-179.5, 0.3)],
+        ]
+
+    def test_matches_per_track(self, tracks):
+        all_coords = np.concatenate([np.array(t) for t in tracks])
+        offsets = np.concatenate([[0], np.cumsum([len(t) for t in tracks])])
+        batch = process_linestrings_batch(all_coords, offsets)
+        for t, start, end in zip(tracks, offsets[:-1], offsets[1:]):
+            if len(t) < 2:
+                assert batch[2][start] == 0.0
+                assert batch[3][start] == 0.0
+                continue
+            single = process_linestring(LineString(t))
+            for got, expected in zip(batch, single):
+                np.testing.assert_allclose(got[start:end], expected, atol=1e-6)
+
+    def test_empty_track_allowed(self):
+        coords = np.array([(0.0, 0.0), (0.0, 1.0), (1.0, 0.0), (2.0, 0.0)])
+        _, _, _, distances = process_linestrings_batch(coords, [0, 2, 2, 4])
+        assert distances[0] == 0.0
+        assert distances[2] == 0.0
+        assert distances[3] == pytest.approx(111319.5, rel=1e-4)
+
+        _, _, _, distances = process_linestrings_batch(coords, [0, 0, 2, 4, 4])
+        assert distances[2] == 0.0
+        assert distances[3] == pytest.approx(111319.5, rel=1e-4)
+
+    def test_bad_offsets_raise(self):
+        coords = np.zeros((4, 2))
+        with pytest.raises(HyPlanValueError):
+            process_linestrings_batch(coords, [0, 3])
+        with pytest.raises(HyPlanValueError):
+            process_linestrings_batch(coords, [0, 3, 2, 4])
+
+    def test_bad_coords_shape_raises(self):
+        with pytest.raises(HyPlanValueError):
+            process_linestrings_batch(np.zeros((4, 3)), [0, 4])
+
+
 class TestDdToDdms:
     def test_known_coordinate(self):
         # 37.405 degrees = 37 deg 24 min 18.0 sec
@@ -352,6 +577,26 @@ class TestRandomPointsInPolygon:
         for pt in points:
             assert isinstance(pt, Point)
 
+    def test_triangulation_cached(self):
+        poly = Polygon([(0, 0), (7, 0), (7, 3), (0, 3)])
+        random_points_in_polygon(poly, 10)
+        hits = _triangulation_setup.cache_info().hits
+        random_points_in_polygon(Polygon(poly.exterior.coords), 10)
+        assert _triangulation_setup.cache_info().hits == hits + 1
+
+    def test_reproducible_with_numpy_seed(self):
+        poly = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])
+        np.random.seed(1234)
+        first = random_points_in_polygon(poly, 20)
+        np.random.seed(1234)
+        second = random_points_in_polygon(poly, 20)
+        assert [p.coords[0] for p in first] == [p.coords[0] for p in second]
+
+    def test_points_inside_triangle(self):
+        tri = Polygon([(0, 0), (10, 1), (3, 8)])
+        points = random_points_in_polygon(tri, 500)
+        assert all(tri.buffer(1e-9).contains(pt) for pt in points)
+
 
 class TestTrueToMagnetic:
     def test_zero_declination(self):
@@ -387,6 +632,24 @@ class TestCalculateGeographicMeanExtended:
         mean = calculate_geographic_mean(pts)
         assert mean.x == pytest.approx(1.0, abs=0.1)
 
+    def test_polygon_holes_ignored(self):
+        outer = [(-118, 34), (-117, 34), (-117, 35), (-118, 35)]
+        hole = [(-117.9, 34.1), (-117.6, 34.1), (-117.6, 34.3)]
+        with_hole = calculate_geographic_mean(Polygon(outer, holes=[hole]))
+        without = calculate_geographic_mean(Polygon(outer))
+        assert with_hole.equals(without)
+
+    def test_as_tuple(self):
+        line = LineString([(-118, 34), (-117, 35)])
+        lon, lat = calculate_geographic_mean(line, as_point=False)
+        point = calculate_geographic_mean(line)
+        assert isinstance(lon, float) and isinstance(lat, float)
+        assert (lon, lat) == (point.x, point.y)
+
+    def test_empty_list_raises(self):
+        with pytest.raises(HyPlanValueError):
+            calculate_geographic_mean([])
+
     def test_invalid_input_raises(self):
         with pytest.raises(HyPlanTypeError):
             calculate_geographic_mean("not a geometry")